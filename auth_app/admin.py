@@ -1,12 +1,11 @@
 """
 Admin configuration for auth_app.
 
-We register (if enabled) the SimpleJWT blacklist models so you can inspect:
+Logout revocation no longer uses the SimpleJWT blacklist tables (see
+auth_app.services). If 'rest_framework_simplejwt.token_blacklist' is added
+back to INSTALLED_APPS, its models are registered here so you can inspect:
 - issued refresh tokens (OutstandingToken)
 - blacklisted refresh tokens (BlacklistedToken)
-
-This directly supports:
-POST /api/logout/  -> refresh token becomes invalid (blacklist)
 """
 
 from django.contrib import admin
@@ -1,8 +1,17 @@
+import hmac
 from django.contrib.auth import get_user_model
+from django.core.validators import EmailValidator
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
 from rest_framework import serializers
 
 User = get_user_model()
 
+# Shared across requests: DRF passes `validators` through uncopied when it clones
+# declared fields, whereas EmailField builds a new EmailValidator per serializer.
+_EMAIL_VALIDATOR = EmailValidator(message="Enter a valid email address.")
+
 
 class RegisterSerializer(serializers.Serializer):
     """
@@ -12,34 +21,61 @@ class RegisterSerializer(serializers.Serializer):
     username = serializers.CharField(max_length=150)
     password = serializers.CharField(write_only=True, min_length=8)
     confirmed_password = serializers.CharField(write_only=True, min_length=8)
-    email = serializers.EmailField()
+    email = serializers.CharField(max_length=254, validators=[_EMAIL_VALIDATOR])
 
     def validate_username(self, value: str) -> str:
-        username = value.strip()
-        if User.objects.filter(username__iexact=username).exists():
-            raise serializers.ValidationError("Username is already taken.")
-        return username
+        return User.normalize_username(value.strip())
 
     def validate_email(self, value: str) -> str:
-        email = value.strip().lower()
-        if User.objects.filter(email__iexact=email).exists():
-            raise serializers.ValidationError("Email is already in use.")
-        return email
+        return value.strip().lower()
 
     def validate(self, attrs):
         password = attrs.get("password", "")
         confirmed_password = attrs.get("confirmed_password", "")
-        if password != confirmed_password:
+        # Runs before any database access (uniqueness is only resolved on insert).
+        if not hmac.compare_digest(password.encode(), confirmed_password.encode()):
             raise serializers.ValidationError({"confirmed_password": "Passwords do not match."})
         return attrs
 
     def create(self, validated_data):
-        return User.objects.create_user(
-            username=validated_data["username"],
-            email=validated_data["email"],
-            password=validated_data["password"],
+        validated_data.pop("confirmed_password", None)
+        password = validated_data.pop("password")
+        user = User(**validated_data)
+        # Hash before opening the transaction: the password hasher is the slowest
+        # step of registration and should not run while the transaction is open.
+        user.set_password(password)
+
+        # Uniqueness is enforced by the case-insensitive unique indexes on auth_user,
+        # so concurrent registrations cannot slip past a pre-check.
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            raise serializers.ValidationError(
+                self._conflict_errors(validated_data["username"], validated_data["email"])
+            )
+        return user
+
+    @staticmethod
+    def _conflict_errors(username: str, email: str) -> dict:
+        """Map a failed insert back to per-field errors (only runs on the conflict path)."""
+        # Written against LOWER(...) (not __iexact, which compiles to UPPER/LIKE) so the
+        # lookup can use the functional unique indexes; the email branch repeats the
+        # partial index predicate.
+        rows = (
+            User.objects.alias(username_lower=Lower("username"), email_lower=Lower("email"))
+            .filter(Q(username_lower=username.lower()) | (Q(email_lower=email) & ~Q(email="")))
+            .values_list("username", "email")
         )
 
+        errors = {}
+        for existing_username, existing_email in rows:
+            if existing_username.lower() == username.lower():
+                errors["username"] = ["Username is already taken."]
+            if (existing_email or "").lower() == email:
+                errors["email"] = ["Email is already in use."]
+        return errors or {"username": ["Username or email is already in use."]}
+
 
 class LoginSerializer(serializers.Serializer):
     """
@@ -0,0 +1,67 @@
+# Generated by Django 6.0.1 on 2026-10-15 09:12
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+# Case-insensitive uniqueness for registration. The register endpoint relies on these
+# indexes instead of a racy exists() pre-check. They are functional indexes on the
+# (swappable) user table, which AddConstraint cannot target from this app, hence SQL.
+# Superusers created via createsuperuser may have an empty email, so those rows are
+# excluded from the email index.
+_INDEXES = (
+    ("username", "username_lower_uniq", ""),
+    ("email", "email_lower_uniq", "WHERE {column} <> ''"),
+)
+
+
+def _user_model(apps):
+    return apps.get_model(settings.AUTH_USER_MODEL)
+
+
+def _check_duplicates(User, field: str) -> None:
+    """Fail with the offending values instead of a bare IntegrityError from CREATE INDEX."""
+    duplicates = list(
+        User.objects.exclude(**{field: ""})
+        .values(lowered=Lower(field))
+        .annotate(n=Count("pk"))
+        .filter(n__gt=1)
+        .values_list("lowered", flat=True)[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"Cannot add the case-insensitive unique index on {User._meta.db_table}.{field}: "
+            f"these values exist more than once when case is ignored: {duplicates}. "
+            f"Rename or merge those users, then run migrate again."
+        )
+
+
+def create_indexes(apps, schema_editor):
+    User = _user_model(apps)
+    table = User._meta.db_table
+    quote = schema_editor.quote_name
+    for field, suffix, condition in _INDEXES:
+        _check_duplicates(User, field)
+        column = quote(User._meta.get_field(field).column)
+        schema_editor.execute(
+            f"CREATE UNIQUE INDEX {quote(f'{table}_{suffix}')} ON {quote(table)} "
+            f"(LOWER({column})) {condition.format(column=column)}".rstrip()
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    table = _user_model(apps)._meta.db_table
+    for _field, suffix, _condition in _INDEXES:
+        schema_editor.execute(f"DROP INDEX {schema_editor.quote_name(f'{table}_{suffix}')}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -1,3 +1,22 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class UserAuthState(models.Model):
+    """
+    Per-user JWT state.
+
+    jwt_version is embedded into every issued token as the "ver" claim.
+    Bumping it revokes all tokens of the user at once, without a per-request
+    denylist lookup (the user row is loaded during authentication anyway).
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="auth_state",
+    )
+    jwt_version = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"AuthState (User #{self.user_id}, v{self.jwt_version})"
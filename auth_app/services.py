@@ -1,10 +1,35 @@
 from __future__ import annotations
-from typing import Dict
+import time
+from typing import Any, Dict
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+from .models import UserAuthState
+
+JWT_VERSION_CLAIM = "ver"
+
+
+def get_jwt_version(user) -> int:
+    """Current token version of the user (0 until the first revocation)."""
+    try:
+        return user.auth_state.jwt_version
+    except UserAuthState.DoesNotExist:
+        return 0
+
+
+def bump_jwt_version(user_id) -> None:
+    """Revoke every token issued to the user so far by bumping the version."""
+    updated = UserAuthState.objects.filter(user_id=user_id).update(
+        jwt_version=F("jwt_version") + 1
+    )
+    # A deleted user has no tokens left to revoke (and no row to point at).
+    if not updated and get_user_model().objects.filter(pk=user_id).exists():
+        UserAuthState.objects.get_or_create(user_id=user_id, defaults={"jwt_version": 1})
 
 
 def build_jwt_tokens_for_user(user) -> Dict[str, str]:
@@ -14,6 +39,8 @@ def build_jwt_tokens_for_user(user) -> Dict[str, str]:
         dict: {"access": "<token>", "refresh": "<token>"}
     """
     refresh = RefreshToken.for_user(user)
+    # Copied into the access token by refresh.access_token.
+    refresh[JWT_VERSION_CLAIM] = get_jwt_version(user)
     access = refresh.access_token
 
     return {
@@ -22,6 +49,35 @@ def build_jwt_tokens_for_user(user) -> Dict[str, str]:
     }
 
 
+def _cookie_attrs(max_age: int) -> Dict[str, Any]:
+    attrs: Dict[str, Any] = {
+        "max-age": max_age,
+        "path": "/",
+        "samesite": settings.JWT_COOKIE_SAMESITE,
+    }
+    if settings.JWT_COOKIE_SECURE:
+        attrs["secure"] = True
+    if settings.JWT_COOKIE_HTTPONLY:
+        attrs["httponly"] = True
+    return attrs
+
+
+# Cookie flags only depend on settings, so they are built once at import time
+# instead of being re-validated by response.set_cookie() on every request.
+_ACCESS_COOKIE_ATTRS = _cookie_attrs(settings.JWT_ACCESS_COOKIE_MAX_AGE)
+_REFRESH_COOKIE_ATTRS = _cookie_attrs(settings.JWT_REFRESH_COOKIE_MAX_AGE)
+_EXPIRED_COOKIE_ATTRS = {
+    "max-age": 0,
+    "path": "/",
+    "expires": "Thu, 01 Jan 1970 00:00:00 GMT",
+}
+
+
+def _write_cookie(response: Response, name: str, value: str, attrs: Dict[str, Any]) -> None:
+    response.cookies[name] = value
+    response.cookies[name].update(attrs)
+
+
 def set_auth_cookies(response: Response, access: str, refresh: str) -> Response:
     """
     Set HTTP-only cookies for access and refresh tokens on the given response.
@@ -29,24 +85,14 @@ def set_auth_cookies(response: Response, access: str, refresh: str) -> Response:
     - access_token
     - refresh_token
     """
-    response.set_cookie(
-        key=settings.JWT_ACCESS_COOKIE_NAME,
-        value=access,
-        max_age=settings.JWT_ACCESS_COOKIE_MAX_AGE,
-        httponly=settings.JWT_COOKIE_HTTPONLY,
-        secure=settings.JWT_COOKIE_SECURE,
-        samesite=settings.JWT_COOKIE_SAMESITE,
-        path="/",
-    )
-    response.set_cookie(
-        key=settings.JWT_REFRESH_COOKIE_NAME,
-        value=refresh,
-        max_age=settings.JWT_REFRESH_COOKIE_MAX_AGE,
-        httponly=settings.JWT_COOKIE_HTTPONLY,
-        secure=settings.JWT_COOKIE_SECURE,
-        samesite=settings.JWT_COOKIE_SAMESITE,
-        path="/",
-    )
+    _write_cookie(response, settings.JWT_ACCESS_COOKIE_NAME, access, _ACCESS_COOKIE_ATTRS)
+    _write_cookie(response, settings.JWT_REFRESH_COOKIE_NAME, refresh, _REFRESH_COOKIE_ATTRS)
+    return response
+
+
+def set_access_cookie(response: Response, access: str) -> Response:
+    """Set only the access_token cookie (used after a token refresh)."""
+    _write_cookie(response, settings.JWT_ACCESS_COOKIE_NAME, access, _ACCESS_COOKIE_ATTRS)
     return response
 
 
@@ -54,22 +100,54 @@ def clear_auth_cookies(response: Response) -> Response:
     """
     Remove auth cookies from the client by deleting them.
     """
-    response.delete_cookie(key=settings.JWT_ACCESS_COOKIE_NAME, path="/")
-    response.delete_cookie(key=settings.JWT_REFRESH_COOKIE_NAME, path="/")
+    _write_cookie(response, settings.JWT_ACCESS_COOKIE_NAME, "", _EXPIRED_COOKIE_ATTRS)
+    _write_cookie(response, settings.JWT_REFRESH_COOKIE_NAME, "", _EXPIRED_COOKIE_ATTRS)
     return response
 
 
+def _denylist_key(jti: str) -> str:
+    return f"jwt:denied:{jti}"
+
+
+def _deny_token(token: Token) -> None:
+    """
+    Put the token's jti on the cache-backed denylist.
+    The entry expires together with the token, so no cleanup job is needed.
+    """
+    ttl = int(token["exp"] - time.time())
+    if ttl > 0:
+        cache.set(_denylist_key(token[api_settings.JTI_CLAIM]), 1, timeout=ttl)
+
+
+def is_token_denied(token: Token) -> bool:
+    """Return True if the token was revoked (e.g. on logout)."""
+    return cache.get(_denylist_key(token[api_settings.JTI_CLAIM])) is not None
+
+
 def blacklist_refresh_token(refresh_token: str) -> None:
     """
-    Blacklist the given refresh token so it cannot be used again.
+    Blacklist the given refresh token so it cannot be used again and bump the
+    user's jwt_version, which invalidates all access tokens issued so far.
     Raises:
         TokenError: If the token is invalid/expired.
     """
     token = RefreshToken(refresh_token)
-    token.blacklist()
+    _deny_token(token)
+    bump_jwt_version(token[api_settings.USER_ID_CLAIM])
 
 
 def refresh_access_token(refresh_token: str) -> str:
     """Create a new access token from a refresh token."""
     token = RefreshToken(refresh_token)
+    if is_token_denied(token):
+        raise TokenError("Token is blacklisted")
+
+    current_version = (
+        UserAuthState.objects.filter(user_id=token[api_settings.USER_ID_CLAIM])
+        .values_list("jwt_version", flat=True)
+        .first()
+    ) or 0
+    if token.get(JWT_VERSION_CLAIM, 0) != current_version:
+        raise TokenError("Token has been revoked")
+
     return str(token.access_token)
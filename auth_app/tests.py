@@ -1,3 +1,178 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+
+from .api.serializers import RegisterSerializer
+from .models import UserAuthState
+
+User = get_user_model()
+
+
+class RegisterConflictTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user(username="carol", email="carol@example.com", password="s3cret-pass")
+
+    def register(self, username, email):
+        return self.client.post(
+            reverse("register"),
+            {
+                "username": username,
+                "email": email,
+                "password": "an0ther-pass",
+                "confirmed_password": "an0ther-pass",
+            },
+            content_type="application/json",
+        )
+
+    def test_register_creates_user(self):
+        response = self.register("dave", "dave@example.com")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(User.objects.filter(username="dave").exists())
+
+    def test_duplicate_username_is_a_username_error(self):
+        # No pre-check: the conflict surfaces as an IntegrityError from the
+        # case-insensitive unique index and is mapped back to the field.
+        with mock.patch.object(
+            RegisterSerializer, "_conflict_errors", wraps=RegisterSerializer._conflict_errors
+        ) as conflict_errors:
+            response = self.register("Carol", "other@example.com")
+
+        conflict_errors.assert_called_once_with("Carol", "other@example.com")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"username": ["Username is already taken."]})
+
+    def test_duplicate_email_is_an_email_error(self):
+        response = self.register("erin", "CAROL@example.com")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"email": ["Email is already in use."]})
+
+    def test_duplicate_username_and_email_report_both_fields(self):
+        response = self.register("carol", "carol@example.com")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            {"username": ["Username is already taken."], "email": ["Email is already in use."]},
+        )
+        self.assertEqual(User.objects.count(), 1)
+
+
+class LogoutRevocationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user(username="bob", email="bob@example.com", password="s3cret-pass")
+
+    def setUp(self):
+        response = self.client.post(
+            reverse("login"),
+            {"username": "bob", "password": "s3cret-pass"},
+            content_type="application/json",
+        )
+        self.access = response.cookies["access_token"].value
+        self.refresh = response.cookies["refresh_token"].value
+
+    def use_old_tokens(self):
+        # Logout clears the client's cookies; a stolen copy keeps the old values.
+        self.client.cookies["access_token"] = self.access
+        self.client.cookies["refresh_token"] = self.refresh
+
+    def test_access_token_works_before_logout(self):
+        self.assertEqual(self.client.get(reverse("quiz-list")).status_code, 200)
+
+    def test_logout_revokes_issued_access_token(self):
+        self.assertEqual(self.client.post(reverse("logout")).status_code, 200)
+        self.use_old_tokens()
+
+        response = self.client.get(reverse("quiz-list"))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["detail"], "Token has been revoked.")
+
+    def test_logout_revokes_refresh_token(self):
+        self.client.post(reverse("logout"))
+        self.use_old_tokens()
+
+        response = self.client.post(reverse("token-refresh"))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"detail": "Invalid refresh token."})
+
+    def test_logout_revokes_tokens_of_other_sessions(self):
+        # A second login (another device) logs out; only its refresh token is
+        # denylisted, the first session is revoked through the bumped jwt_version.
+        other = self.client_class()
+        other.post(
+            reverse("login"),
+            {"username": "bob", "password": "s3cret-pass"},
+            content_type="application/json",
+        )
+        self.assertEqual(other.post(reverse("logout")).status_code, 200)
+
+        self.assertEqual(self.client.get(reverse("quiz-list")).status_code, 401)
+        self.assertEqual(self.client.post(reverse("token-refresh")).status_code, 401)
+
+    def test_logout_of_deleted_user_clears_cookies(self):
+        User.objects.filter(username="bob").delete()
+
+        response = self.client.post(reverse("logout"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.cookies["access_token"].value, "")
+        self.assertEqual(response.cookies["refresh_token"].value, "")
+        self.assertFalse(UserAuthState.objects.exists())
+
+    def test_login_after_logout_issues_working_tokens(self):
+        self.client.post(reverse("logout"))
+        self.client.post(
+            reverse("login"),
+            {"username": "bob", "password": "s3cret-pass"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(self.client.get(reverse("quiz-list")).status_code, 200)
+        self.assertEqual(self.client.post(reverse("token-refresh")).status_code, 200)
+
+
+class LoginViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="alice", email="alice@example.com", password="s3cret-pass"
+        )
+
+    def login(self, password="s3cret-pass"):
+        return self.client.post(
+            reverse("login"),
+            {"username": "alice", "password": password},
+            content_type="application/json",
+        )
+
+    def test_login_returns_user_payload_and_sets_cookies(self):
+        response = self.login()
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(set(body), {"detail", "user"})
+        self.assertEqual(body["detail"], "Login successfully!")
+        self.assertEqual(
+            body["user"],
+            {"id": self.user.id, "username": "alice", "email": "alice@example.com"},
+        )
+        for name in ("access_token", "refresh_token"):
+            self.assertIn(name, response.cookies)
+            self.assertTrue(response.cookies[name].value)
+            self.assertTrue(response.cookies[name]["httponly"])
+            self.assertEqual(response.cookies[name]["path"], "/")
+
+    def test_login_with_wrong_password_is_rejected(self):
+        response = self.login(password="wrong-pass")
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"detail": "Invalid credentials."})
+        self.assertNotIn("access_token", response.cookies)
+        self.assertNotIn("refresh_token", response.cookies)
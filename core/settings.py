@@ -48,8 +48,8 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     "rest_framework",
     "corsheaders",
-    # SimpleJWT blacklist app (required to invalidate refresh tokens on logout)
-    "rest_framework_simplejwt.token_blacklist",
+    # No SimpleJWT blacklist app: revocation is handled by auth_app (cache denylist +
+    # token version), so logins skip the OutstandingToken insert.
 
     "auth_app",
     "quizly_app",
@@ -91,14 +91,51 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# Connections are kept open between requests (CONN_MAX_AGE) so the auth and quiz
+# queries skip the connect/setup cost; health checks drop broken connections.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': int(os.environ.get("DB_CONN_MAX_AGE", "60")),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# Cache
+# The JWT denylist (logout) lives in the cache. Set REDIS_URL in production so all
+# workers share it; the local-memory fallback is per-process and meant for development.
+
+REDIS_URL = os.environ.get("REDIS_URL", "").strip()
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
+# Password hashing
+# Argon2id is the primary hasher; the PBKDF2/Scrypt entries stay so existing
+# hashes still verify and are upgraded to Argon2 on the user's next login.
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -150,7 +187,8 @@ REST_FRAMEWORK = {
         "auth_app.authentication.CookieJWTAuthentication",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        # orjson-backed JSON output (same format as DRF's JSONRenderer).
+        "core.renderers.OrjsonRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
 }
@@ -211,7 +249,7 @@ SIMPLE_JWT = {
 
     # Optional, aber sinnvoll:
     "ROTATE_REFRESH_TOKENS": False,
-    "BLACKLIST_AFTER_ROTATION": True,
+    "BLACKLIST_AFTER_ROTATION": False,
 
     # Wenn du Cookies nutzt, ist Header-Auth optional – du kannst es trotzdem lassen
     "AUTH_HEADER_TYPES": ("Bearer",),
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from django.contrib import admin
-from quizly_app.models import Quiz, Question, QuizAttempt, AttemptAnswer
+from quizly_app.models import Quiz, Question, QuizAttempt, AttemptAnswer, QuizCreationJob
 
 
 class QuestionInline(admin.TabularInline):
@@ -69,3 +69,15 @@ class AttemptAnswerAdmin(admin.ModelAdmin):
     list_filter = ("is_correct", "created_at")
     search_fields = ("selected_option", "question__question_title")
     ordering = ("-created_at",)
+
+
+@admin.register(QuizCreationJob)
+class QuizCreationJobAdmin(admin.ModelAdmin):
+    """Admin-Ansicht für Hintergrund-Jobs der Quiz-Erstellung."""
+
+    list_display = ("id", "user", "status", "quiz", "created_at", "updated_at")
+    list_select_related = ("user", "quiz")
+    list_filter = ("status", "created_at")
+    search_fields = ("url", "user__username", "error")
+    ordering = ("-created_at",)
+    readonly_fields = ("created_at", "updated_at")
@@ -1,6 +1,42 @@
 from __future__ import annotations
+from operator import attrgetter
+from django.db import models
 from rest_framework import serializers
-from quizly_app.models import Quiz, Question, AttemptAnswer, QuizAttempt
+from quizly_app.models import Quiz, Question, AttemptAnswer, QuizAttempt, QuizCreationJob
+
+
+def _field_accessors(fields) -> list:
+    """
+    (name, getter, to_representation) per field. Single-attribute sources get a
+    C-level attrgetter instead of Field.get_attribute's generic source walk.
+    """
+    accessors = []
+    for field in fields:
+        if len(field.source_attrs) == 1:
+            getter = attrgetter(field.source_attrs[0])
+        else:
+            getter = field.get_attribute
+        accessors.append((field.field_name, getter, field.to_representation))
+    return accessors
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer that resolves the child's readable fields once per list
+    instead of once per item. Read-only output only.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        accessors = _field_accessors(self.child._readable_fields)
+        rows = []
+        for item in iterable:
+            row = {}
+            for name, getter, to_representation in accessors:
+                attribute = getter(item)
+                row[name] = None if attribute is None else to_representation(attribute)
+            rows.append(row)
+        return rows
 
 
 class QuestionPublicSerializer(serializers.ModelSerializer):
@@ -10,6 +46,7 @@ class QuestionPublicSerializer(serializers.ModelSerializer):
         model = Question
         fields = ("id", "question_title", "question_options", "answer")
         read_only_fields = ("id",)
+        list_serializer_class = FastListSerializer
 
 
 class QuestionCreateResponseSerializer(serializers.ModelSerializer):
@@ -28,24 +65,6 @@ class QuestionCreateResponseSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "updated_at")
 
 
-class QuizListSerializer(serializers.ModelSerializer):
-    """GET /api/quizzes/ response serializer."""
-    questions = QuestionPublicSerializer(many=True, read_only=True)
-
-    class Meta:
-        model = Quiz
-        fields = (
-            "id",
-            "title",
-            "description",
-            "created_at",
-            "updated_at",
-            "video_url",
-            "questions",
-        )
-        read_only_fields = ("id", "created_at", "updated_at", "questions")
-
-
 class QuizDetailSerializer(serializers.ModelSerializer):
     """GET /api/quizzes/{id}/ response serializer."""
     questions = QuestionPublicSerializer(many=True, read_only=True)
@@ -82,6 +101,16 @@ class QuizCreateResponseSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "updated_at", "questions")
 
 
+class QuizCreationJobSerializer(serializers.ModelSerializer):
+    """Status of a background quiz creation (POST /api/createQuiz/ with "async": true)."""
+    quiz_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = QuizCreationJob
+        fields = ("id", "status", "quiz_id", "error", "created_at", "updated_at")
+        read_only_fields = fields
+
+
 class QuizPatchSerializer(serializers.ModelSerializer):
     """PATCH input serializer for updating quiz title/description only."""
 
@@ -92,7 +121,8 @@ class QuizPatchSerializer(serializers.ModelSerializer):
 
 class AttemptAnswerSerializer(serializers.ModelSerializer):
     """Stored answer for a quiz attempt."""
-    question_id = serializers.IntegerField(source="question.id", read_only=True)
+    # Read the FK column directly; source="question.id" loaded each Question row.
+    question_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = AttemptAnswer
@@ -107,11 +137,11 @@ class AttemptAnswerSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "is_correct", "created_at", "updated_at")
 
 
-class QuizAttemptSerializer(serializers.ModelSerializer):
-    """Quiz attempt output including progress and answers."""
-    quiz_id = serializers.IntegerField(source="quiz.id", read_only=True)
+class QuizAttemptCompactSerializer(serializers.ModelSerializer):
+    """Quiz attempt progress without the nested answers."""
+    # The FK column, so serializing never loads the related Quiz.
+    quiz_id = serializers.IntegerField(read_only=True)
     score_percent = serializers.FloatField(read_only=True)
-    answers = AttemptAnswerSerializer(many=True, read_only=True)
 
     class Meta:
         model = QuizAttempt
@@ -126,7 +156,6 @@ class QuizAttemptSerializer(serializers.ModelSerializer):
             "started_at",
             "completed_at",
             "updated_at",
-            "answers",
         )
         read_only_fields = (
             "id",
@@ -137,10 +166,21 @@ class QuizAttemptSerializer(serializers.ModelSerializer):
             "started_at",
             "completed_at",
             "updated_at",
-            "answers",
         )
 
 
+class QuizAttemptSerializer(QuizAttemptCompactSerializer):
+    """
+    Quiz attempt output including progress and answers.
+    Reads the answers from answers_list, i.e. Prefetch("answers", to_attr="answers_list").
+    """
+    answers = AttemptAnswerSerializer(many=True, read_only=True, source="answers_list")
+
+    class Meta(QuizAttemptCompactSerializer.Meta):
+        fields = QuizAttemptCompactSerializer.Meta.fields + ("answers",)
+        read_only_fields = QuizAttemptCompactSerializer.Meta.read_only_fields + ("answers",)
+
+
 class StartAttemptInputSerializer(serializers.Serializer):
     """Input for starting/restarting an attempt."""
     new = serializers.BooleanField(required=False, default=False)
@@ -152,3 +192,16 @@ class SaveAnswerInputSerializer(serializers.Serializer):
     selected_option = serializers.CharField(max_length=255)
     current_question_index = serializers.IntegerField(required=False, min_value=0)
     finish = serializers.BooleanField(required=False, default=False)
+
+
+class AnswerItemInputSerializer(serializers.Serializer):
+    """One answer inside a batch save."""
+    question_id = serializers.IntegerField()
+    selected_option = serializers.CharField(max_length=255)
+
+
+class SaveAnswersBatchInputSerializer(serializers.Serializer):
+    """Input for saving several answers (and progress) in one request."""
+    answers = AnswerItemInputSerializer(many=True, allow_empty=False, max_length=100)
+    current_question_index = serializers.IntegerField(required=False, min_value=0)
+    finish = serializers.BooleanField(required=False, default=False)
@@ -1,57 +1,358 @@
 from __future__ import annotations
+from django.core.cache import cache
 from django.db import transaction
-from django.shortcuts import get_object_or_404
+from django.db.models import Count, F, FilteredRelation, Max, Prefetch, Q, prefetch_related_objects
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.fields import DateTimeField
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from auth_app.authentication import CookieJWTAuthentication
-from quizly_app.services.utils import QuizlyValidationError
+from core.renderers import OrjsonRenderer
+from quizly_app.services.utils import QuizlyValidationError, extract_youtube_video_id
 from quizly_app.api.serializers import (
+    QuizAttemptCompactSerializer,
     QuizAttemptSerializer,
     QuizCreateResponseSerializer,
-    QuizListSerializer,
+    QuizCreationJobSerializer,
     QuizPatchSerializer,
     SaveAnswerInputSerializer,
+    SaveAnswersBatchInputSerializer,
     StartAttemptInputSerializer,
     QuizDetailSerializer,
 )
-from quizly_app.models import AttemptAnswer, Question, Quiz, QuizAttempt
+from quizly_app.models import AttemptAnswer, Question, Quiz, QuizAttempt, QuizCreationJob
 from quizly_app.services.quiz_creation import create_quiz_for_user
+from quizly_app.services.quiz_jobs import expire_stale_jobs, submit_quiz_job
 import logging
+from collections import defaultdict
+import orjson
 logger = logging.getLogger(__name__)
 
-def _get_quiz_or_403(quiz_id: int, user) -> Quiz:
+# Columns read by QuizDetailSerializer ("user" for the ownership check).
+_QUIZ_READ_FIELDS = ("id", "user", "title", "description", "created_at", "updated_at", "video_url")
+_QUESTION_READ_FIELDS = ("id", "quiz_id", "question_title", "question_options", "answer")
+
+
+_DATETIME_FIELD = DateTimeField()
+
+
+_QUIZ_LIST_COLUMNS = ("id", "title", "description", "created_at", "updated_at", "video_url")
+
+
+def _quiz_list_rows(rows: list[dict]) -> list[dict]:
+    """
+    Completes Quiz value rows (_QUIZ_LIST_COLUMNS) into the list items, which have the
+    same shape as QuizDetailSerializer's output: the quiz columns plus "questions", a
+    list of {id, question_title, question_options, answer} in id order. One query for
+    all their questions, no model instances or serializers. Datetimes go through
+    DRF's DateTimeField so the format stays identical.
+    """
+    questions = defaultdict(list)
+    question_rows = (
+        Question.objects.filter(quiz_id__in=[row["id"] for row in rows])
+        .order_by("id")
+        .values_list("quiz_id", "id", "question_title", "question_options", "answer")
+    )
+    for quiz_id, question_id, title, options, answer in question_rows:
+        questions[quiz_id].append(
+            {
+                "id": question_id,
+                "question_title": title,
+                "question_options": options,
+                "answer": answer,
+            }
+        )
+    to_datetime = _DATETIME_FIELD.to_representation
+    for row in rows:
+        row["created_at"] = to_datetime(row["created_at"])
+        row["updated_at"] = to_datetime(row["updated_at"])
+        row["questions"] = questions.get(row["id"], [])
+    return rows
+
+
+def _quiz_read_queryset():
+    """Quizzes with questions, limited to the columns the read serializers emit."""
+    return Quiz.objects.only(*_QUIZ_READ_FIELDS).prefetch_related(
+        Prefetch("questions", queryset=Question.objects.only(*_QUESTION_READ_FIELDS))
+    )
+
+# Rendered quiz detail/list JSON, keyed on updated_at (per quiz, or the user's list
+# version). PATCH bumps updated_at through auto_now and question saves/deletes through
+# quizly_app.signals; orphaned keys simply expire. Bulk question writes (bulk_update,
+# QuerySet.update) send no signals and have to touch the quiz themselves.
+_QUIZ_CACHE_TTL = 60 * 60
+
+
+def _quiz_detail_cache_key(quiz_id: int, updated_at) -> str:
+    return f"quiz:detail:{quiz_id}:{updated_at.timestamp()}"
+
+
+def _quiz_list_cache_key(user_id: int, version: str) -> str:
+    return f"quiz:list:{user_id}:{version}"
+
+
+_QUIZ_FORBIDDEN = "You do not have permission to access this quiz."
+_JOB_FORBIDDEN = "You do not have permission to access this job."
+_ATTEMPT_FORBIDDEN = "You do not have permission to access this attempt."
+
+
+def _raise_missing_or_forbidden(model, pk: int, forbidden_message: str):
+    """
+    Called only after an owner-filtered lookup missed: a cheap EXISTS tells
+    another user's row (403) apart from a missing one (404).
+    """
+    if model.objects.filter(pk=pk).exists():
+        raise PermissionDenied(forbidden_message)
+    raise Http404(f"No {model._meta.object_name} matches the given query.")
+
+
+def _get_quiz_or_403(quiz_id: int, user_id: int, queryset=None) -> Quiz:
     """
     Loads a quiz by id and ensures it belongs to the requesting user.
     Raises 404 if quiz doesn't exist, 403 if it belongs to another user.
     """
-    quiz = get_object_or_404(Quiz, pk=quiz_id)
-    if quiz.user_id != user.id:
-        raise PermissionDenied("You do not have permission to access this quiz.")
-    return quiz
+    qs = queryset if queryset is not None else Quiz.objects.all()
+    try:
+        return qs.get(pk=quiz_id, user_id=user_id)
+    except Quiz.DoesNotExist:
+        _raise_missing_or_forbidden(Quiz, quiz_id, _QUIZ_FORBIDDEN)
 
 
-def _get_attempt_or_403(attempt_id: int, user) -> QuizAttempt:
+def _get_attempt_or_403(
+    attempt_id: int, user_id: int, *, select_related=(), prefetch_related=(), for_update=False
+) -> QuizAttempt:
     """
     Loads an attempt by id and ensures it belongs to the requesting user.
     Raises 404 if attempt doesn't exist, 403 if it belongs to another user.
+    Related objects are loaded in the same round trip when requested;
+    for_update locks the attempt row (must run inside a transaction).
+    """
+    qs = QuizAttempt.objects.all()
+    if for_update:
+        qs = qs.select_for_update(of=("self",))
+    if select_related:
+        qs = qs.select_related(*select_related)
+    if prefetch_related:
+        qs = qs.prefetch_related(*prefetch_related)
+    try:
+        return qs.get(pk=attempt_id, user_id=user_id)
+    except QuizAttempt.DoesNotExist:
+        _raise_missing_or_forbidden(QuizAttempt, attempt_id, _ATTEMPT_FORBIDDEN)
+
+
+# Conditional GET support. ETags (not Last-Modified) are used because Last-Modified
+# only has one-second resolution and answers are often saved within the same second.
+# The lookups filter by owner, so foreign/missing rows yield no ETag and the view
+# still answers 403/404. Quiz ETags only read Quiz.updated_at: question saves and
+# deletes bump it (quizly_app.signals), so the nested questions are covered without
+# aggregating over Question.updated_at.
+
+
+def _version_etag(*parts) -> str:
+    return "-".join(str(part) for part in parts)
+
+
+def _quiz_list_version(request) -> str:
+    """
+    (count, last updated_at) of the user's quizzes: changes on every create, edit and
+    delete, including question changes (they bump the quiz's updated_at). Computed
+    once per request and shared by the ETag and the list cache.
+    """
+    version = getattr(request, "_quiz_list_version", None)
+    if version is None:
+        agg = Quiz.objects.filter(user_id=request.user.id).aggregate(
+            n=Count("pk"), last=Max("updated_at")
+        )
+        last = agg["last"].timestamp() if agg["last"] else 0
+        version = request._quiz_list_version = _version_etag(agg["n"], last)
+    return version
+
+
+def _quiz_list_etag(request) -> str:
+    params = request.query_params
+    return _version_etag(
+        "quizzes", _quiz_list_version(request), params.get("limit"), params.get("offset")
+    )
+
+
+def _quiz_updated_at(request, quiz_id: int):
+    """
+    updated_at of the user's quiz (None if missing or foreign). Queried once per
+    request and shared by the ETag and the detail cache key.
+    """
+    memo = getattr(request, "_quiz_updated_at", None)
+    if memo is None or memo[0] != quiz_id:
+        updated_at = (
+            Quiz.objects.filter(pk=quiz_id, user_id=request.user.id)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        memo = request._quiz_updated_at = (quiz_id, updated_at)
+    return memo[1]
+
+
+def _quiz_etag(request, quiz_id: int) -> str | None:
+    updated_at = _quiz_updated_at(request, quiz_id)
+    return _version_etag("quiz", quiz_id, updated_at.timestamp()) if updated_at else None
+
+
+def _attempt_etag(request, attempt_id: int) -> str | None:
+    updated_at = (
+        QuizAttempt.objects.filter(pk=attempt_id, user_id=request.user.id)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    return _version_etag("attempt", attempt_id, updated_at.timestamp()) if updated_at else None
+
+
+_COMPLETED_RESULT_CACHE_CONTROL = "private, max-age=300"
+
+
+def _include_result_details(request) -> bool:
+    return request.query_params.get("details") in ("1", "true", "True")
+
+
+def _attempt_result_etag(request, attempt_id: int) -> str | None:
+    etag = _attempt_etag(request, attempt_id)
+    if etag is None:
+        return None
+    return _version_etag("result", etag, int(_include_result_details(request)))
+
+
+def _upsert_answers(answers: list[AttemptAnswer]) -> list[AttemptAnswer]:
+    """
+    Inserts or updates answers in one INSERT ... ON CONFLICT DO UPDATE on the
+    (attempt, question) unique constraint; created_at is kept on conflict.
+    """
+    return AttemptAnswer.objects.bulk_create(
+        answers,
+        update_conflicts=True,
+        unique_fields=["attempt", "question"],
+        update_fields=["selected_option", "is_correct", "updated_at"],
+    )
+
+
+def _answers_prefetch() -> Prefetch:
+    """
+    Loads an attempt's answers into the plain list attempt.answers_list,
+    which QuizAttemptSerializer reads.
+    """
+    return Prefetch("answers", to_attr="answers_list")
+
+
+def _save_attempt_answers(attempt: QuizAttempt, selections: dict) -> int:
+    """
+    Upserts {question_id: (selected_option, is_correct)} for the attempt and returns
+    the change in correct answers. The caller must hold the attempt row lock.
+
+    The attempt's answers are loaded once: they give the previous is_correct values
+    and are patched in place afterwards, so the response needs no re-query.
+    """
+    if not hasattr(attempt, "answers_list"):
+        prefetch_related_objects([attempt], _answers_prefetch())
+    answers = attempt.answers_list
+    existing = {a.question_id: a for a in answers if a.question_id in selections}
+
+    delta = 0
+    rows = []
+    for question_id, (selected_option, is_correct) in selections.items():
+        previous = existing.get(question_id)
+        delta += int(is_correct) - int(previous.is_correct if previous else False)
+        rows.append(
+            AttemptAnswer(
+                attempt=attempt,
+                question_id=question_id,
+                selected_option=selected_option,
+                is_correct=is_correct,
+            )
+        )
+
+    reload = False
+    for saved in _upsert_answers(rows):
+        previous = existing.get(saved.question_id)
+        if previous is not None:
+            previous.selected_option = saved.selected_option
+            previous.is_correct = saved.is_correct
+            previous.updated_at = saved.updated_at
+        elif saved.pk is not None:
+            answers.append(saved)
+        else:
+            reload = True
+    if reload:
+        # Backend could not return the new primary keys: reload the answers instead.
+        attempt.answers_list = list(attempt.answers.all())
+    return delta
+
+
+def _apply_attempt_progress(attempt: QuizAttempt, delta: int, data: dict) -> None:
     """
-    attempt = get_object_or_404(QuizAttempt, pk=attempt_id)
-    if attempt.user_id != user.id:
-        raise PermissionDenied("You do not have permission to access this attempt.")
-    return attempt
+    Writes the score delta, optional current_question_index and optional finish
+    in one UPDATE (F() for the counter) and mirrors them on the instance.
+    Completed attempts get their score recounted instead, since AttemptResultView
+    treats a completed attempt's counters as final.
+    """
+    attempt.correct_count += delta
+    attempt.updated_at = timezone.now()
+    updates = {"correct_count": F("correct_count") + delta, "updated_at": attempt.updated_at}
+
+    if "current_question_index" in data:
+        attempt.current_question_index = data["current_question_index"]
+        updates["current_question_index"] = attempt.current_question_index
+
+    if data.get("finish", False) and not attempt.is_completed:
+        attempt.mark_completed()
+        updates["is_completed"] = True
+        updates["completed_at"] = attempt.completed_at
+
+    if attempt.is_completed:
+        _recalculate_attempt_score(attempt)
+        updates["correct_count"] = attempt.correct_count
+        updates["total_questions"] = attempt.total_questions
+
+    QuizAttempt.objects.filter(pk=attempt.pk).update(**updates)
 
 
 def _recalculate_attempt_score(attempt: QuizAttempt) -> None:
     """
     Recomputes correct/total counters based on stored AttemptAnswer rows.
     Keeps total_questions stable if quiz has no questions for any reason.
+    Reconciliation only: the write paths maintain correct_count incrementally and
+    recount on completion.
+    """
+    agg = AttemptAnswer.objects.filter(attempt=attempt).aggregate(
+        correct=Count("pk", filter=Q(is_correct=True))
+    )
+    attempt.correct_count = agg["correct"] or 0
+    attempt.total_questions = attempt.quiz.questions_count or attempt.total_questions
+
+
+def _iter_result_json(result: dict, rows):
     """
-    correct = AttemptAnswer.objects.filter(attempt=attempt, is_correct=True).count()
-    attempt.correct_count = correct
-    attempt.total_questions = attempt.quiz.questions.count() or attempt.total_questions
+    Yields the result payload as JSON chunks: the summary object opened up,
+    then one encoded detail per question row, then the closing brackets.
+    """
+    yield orjson.dumps(result)[:-1] + b',"details":['
+    separator = b""
+    for question_id, title, options, answer, selected_option, is_correct in rows:
+        yield separator + orjson.dumps(
+            {
+                "question_id": question_id,
+                "question_title": title,
+                "question_options": options,
+                "correct_answer": answer,
+                "selected_option": selected_option,
+                "is_correct": bool(is_correct),
+            }
+        )
+        separator = b","
+    yield b"]}"
 
 
 class CreateQuizView(APIView):
@@ -67,6 +368,15 @@ class CreateQuizView(APIView):
         if not url:
             return Response({"detail": "Missing 'url'."}, status=status.HTTP_400_BAD_REQUEST)
 
+        if request.data.get("async") is True:
+            # Runs the pipeline on the background pool; poll the returned job.
+            try:
+                extract_youtube_video_id(url)
+            except QuizlyValidationError as exc:
+                return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            job = submit_quiz_job(user=request.user, url=url)
+            return Response(QuizCreationJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
         try:
             quiz = create_quiz_for_user(user=request.user, url=url)
         except QuizlyValidationError as exc:
@@ -76,20 +386,55 @@ class CreateQuizView(APIView):
         return Response(QuizCreateResponseSerializer(quiz).data, status=status.HTTP_201_CREATED)
 
 
+class QuizCreationJobView(APIView):
+    """
+    Returns the status of a background quiz creation of the authenticated user.
+    Read-only endpoint; once "succeeded", quiz_id points to the created quiz.
+    """
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CookieJWTAuthentication]
+
+    def get(self, request, job_id: int):
+        # A job orphaned by a restart would otherwise report "pending" forever.
+        expire_stale_jobs(pk=job_id, user_id=request.user.id)
+        job = QuizCreationJob.objects.filter(pk=job_id, user_id=request.user.id).first()
+        if job is None:
+            _raise_missing_or_forbidden(QuizCreationJob, job_id, _JOB_FORBIDDEN)
+        return Response(QuizCreationJobSerializer(job).data, status=status.HTTP_200_OK)
+
+
+class QuizListPagination(LimitOffsetPagination):
+    """Opt-in limit/offset pagination for the quiz list."""
+    max_limit = 100
+
+
 class QuizListView(APIView):
     """
     Returns all quizzes belonging to the authenticated user (including questions).
     GET is safe, but we still require authentication.
+    Pagination is opt-in: without ?limit= the response stays a plain list.
     """
     permission_classes = [IsAuthenticated]
     authentication_classes = [CookieJWTAuthentication]
+    pagination_class = QuizListPagination
 
+    @method_decorator(condition(etag_func=_quiz_list_etag))
     def get(self, request):
-        quizzes = Quiz.objects.filter(user=request.user).prefetch_related("questions")
-        return Response(
-            QuizListSerializer(quizzes, many=True).data,
-            status=status.HTTP_200_OK,
-        )
+        quizzes = Quiz.objects.filter(user_id=request.user.id).values(*_QUIZ_LIST_COLUMNS)
+
+        if self.pagination_class.limit_query_param in request.query_params:
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(quizzes, request, view=self)
+            return paginator.get_paginated_response(_quiz_list_rows(page))
+
+        # The unpaginated list is cached as rendered JSON under the list version, so
+        # repeat loads skip the quiz/question queries until something changes.
+        key = _quiz_list_cache_key(request.user.id, _quiz_list_version(request))
+        payload = cache.get(key)
+        if payload is None:
+            payload = OrjsonRenderer().render(_quiz_list_rows(list(quizzes)))
+            cache.set(key, payload, _QUIZ_CACHE_TTL)
+        return HttpResponse(payload, content_type="application/json")
 
 
 class QuizDetailView(APIView):
@@ -100,18 +445,22 @@ class QuizDetailView(APIView):
     permission_classes = [IsAuthenticated]
     authentication_classes = [CookieJWTAuthentication]
 
-    def _get_quiz_or_403(self, request, quiz_id: int) -> Quiz:
-        quiz = get_object_or_404(Quiz, pk=quiz_id)
-        if quiz.user_id != request.user.id:
-            raise PermissionDenied("You do not have permission to access this quiz.")
-        return quiz
-
+    @method_decorator(condition(etag_func=_quiz_etag))
     def get(self, request, quiz_id: int):
-        quiz = self._get_quiz_or_403(request, quiz_id)
-        return Response(QuizDetailSerializer(quiz).data, status=status.HTTP_200_OK)
+        updated_at = _quiz_updated_at(request, quiz_id)
+        if updated_at is None:
+            _raise_missing_or_forbidden(Quiz, quiz_id, _QUIZ_FORBIDDEN)
+
+        key = _quiz_detail_cache_key(quiz_id, updated_at)
+        payload = cache.get(key)
+        if payload is None:
+            quiz = _quiz_read_queryset().get(pk=quiz_id)
+            payload = OrjsonRenderer().render(QuizDetailSerializer(quiz).data)
+            cache.set(key, payload, _QUIZ_CACHE_TTL)
+        return HttpResponse(payload, content_type="application/json")
 
     def patch(self, request, quiz_id: int):
-        quiz = self._get_quiz_or_403(request, quiz_id)
+        quiz = _get_quiz_or_403(quiz_id=quiz_id, user_id=request.user.id)
 
         serializer = QuizPatchSerializer(quiz, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
@@ -120,7 +469,7 @@ class QuizDetailView(APIView):
         return Response(QuizDetailSerializer(quiz).data, status=status.HTTP_200_OK)
 
     def delete(self, request, quiz_id: int):
-        quiz = self._get_quiz_or_403(request, quiz_id)
+        quiz = _get_quiz_or_403(quiz_id=quiz_id, user_id=request.user.id)
         quiz.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -134,27 +483,47 @@ class StartAttemptView(APIView):
     authentication_classes = [CookieJWTAuthentication]
 
     def post(self, request, quiz_id: int):
-        quiz = _get_quiz_or_403(quiz_id=quiz_id, user=request.user)
-
+        user_id = request.user.id
         data_in = StartAttemptInputSerializer(data=request.data)
         data_in.is_valid(raise_exception=True)
         force_new = data_in.validated_data["new"]
 
         if not force_new:
-            existing = QuizAttempt.objects.filter(
-                user=request.user, quiz=quiz, is_completed=False
-            ).first()
+            # Filtered by the requesting user, so an open attempt implies quiz ownership
+            # and the resume path skips the separate quiz lookup.
+            existing = (
+                QuizAttempt.objects.filter(
+                    user_id=user_id, quiz_id=quiz_id, is_completed=False
+                )
+                .only(
+                    "id",
+                    "quiz_id",
+                    "current_question_index",
+                    "is_completed",
+                    "correct_count",
+                    "total_questions",
+                    "started_at",
+                    "completed_at",
+                    "updated_at",
+                )
+                .prefetch_related(_answers_prefetch())
+                .first()
+            )
             if existing:
                 return Response(QuizAttemptSerializer(existing).data, status=status.HTTP_200_OK)
 
+        quiz = _get_quiz_or_403(quiz_id=quiz_id, user_id=user_id)
         attempt = QuizAttempt.objects.create(
-            user=request.user,
+            user_id=user_id,
             quiz=quiz,
             current_question_index=0,
             is_completed=False,
-            total_questions=quiz.questions.count() or 10,
+            total_questions=quiz.questions_count or 10,
         )
-        return Response(QuizAttemptSerializer(attempt).data, status=status.HTTP_201_CREATED)
+        # A fresh attempt has no answers: skip the nested serializer and its query.
+        data = QuizAttemptCompactSerializer(attempt).data
+        data["answers"] = []
+        return Response(data, status=status.HTTP_201_CREATED)
 
 
 class AttemptDetailView(APIView):
@@ -163,13 +532,12 @@ class AttemptDetailView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(condition(etag_func=_attempt_etag))
     def get(self, request, attempt_id: int):
-        attempt = _get_attempt_or_403(attempt_id=attempt_id, user=request.user)
-        attempt = (
-            QuizAttempt.objects.filter(pk=attempt.pk)
-            .select_related("quiz")
-            .prefetch_related("answers", "quiz__questions")
-            .get()
+        attempt = _get_attempt_or_403(
+            attempt_id=attempt_id,
+            user_id=request.user.id,
+            prefetch_related=(_answers_prefetch(),),
         )
         return Response(QuizAttemptSerializer(attempt).data, status=status.HTTP_200_OK)
 
@@ -184,72 +552,117 @@ class SaveAnswerView(APIView):
 
     @transaction.atomic
     def patch(self, request, attempt_id: int):
-        attempt = _get_attempt_or_403(attempt_id=attempt_id, user=request.user)
+        attempt = _get_attempt_or_403(
+            attempt_id=attempt_id, user_id=request.user.id, for_update=True
+        )
 
         payload = SaveAnswerInputSerializer(data=request.data)
         payload.is_valid(raise_exception=True)
         question_id = payload.validated_data["question_id"]
         selected_option = payload.validated_data["selected_option"]
-        finish = payload.validated_data.get("finish", False)
 
-        question = get_object_or_404(Question, pk=question_id)
-
-        if question.quiz_id != attempt.quiz_id:
-            raise ValidationError("Question does not belong to this quiz.")
+        # Scope the lookup to the attempt's quiz so the ownership check happens in SQL.
+        question = (
+            Question.objects.filter(pk=question_id, quiz_id=attempt.quiz_id)
+            .only("id", "question_options", "answer")
+            .first()
+        )
+        if question is None:
+            raise ValidationError("Question does not belong to this quiz or not found.")
 
-        options = question.question_options or []
-        if selected_option not in options:
+        if selected_option not in question.options_set:
             raise ValidationError("Selected option must be one of question_options.")
 
         is_correct = selected_option == question.answer
 
-        AttemptAnswer.objects.update_or_create(
-            attempt=attempt,
-            question=question,
-            defaults={"selected_option": selected_option, "is_correct": is_correct},
-        )
+        delta = _save_attempt_answers(attempt, {question.id: (selected_option, is_correct)})
+        _apply_attempt_progress(attempt, delta, payload.validated_data)
+        return Response(QuizAttemptSerializer(attempt).data, status=status.HTTP_200_OK)
 
-        if "current_question_index" in payload.validated_data:
-            attempt.current_question_index = payload.validated_data["current_question_index"]
 
-        _recalculate_attempt_score(attempt)
+class SaveAnswersBatchView(APIView):
+    """
+    Saves/updates several answers of an attempt in one request (one upsert statement).
+    Accepts the same progress fields as SaveAnswerView. Write operation => enforce CookieJWTAuthentication.
+    """
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CookieJWTAuthentication]
 
-        if finish and not attempt.is_completed:
-            attempt.mark_completed()
+    @transaction.atomic
+    def patch(self, request, attempt_id: int):
+        attempt = _get_attempt_or_403(
+            attempt_id=attempt_id, user_id=request.user.id, for_update=True
+        )
 
-        attempt.save()
+        payload = SaveAnswersBatchInputSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        # The last entry wins when a question appears more than once.
+        chosen = {
+            item["question_id"]: item["selected_option"]
+            for item in payload.validated_data["answers"]
+        }
 
-        attempt = (
-            QuizAttempt.objects.filter(pk=attempt.pk)
-            .select_related("quiz")
-            .prefetch_related("answers")
-            .get()
-        )
+        questions = {
+            q.id: q
+            for q in Question.objects.filter(pk__in=chosen, quiz_id=attempt.quiz_id).only(
+                "id", "question_options", "answer"
+            )
+        }
+        missing = sorted(set(chosen) - set(questions))
+        if missing:
+            raise ValidationError(
+                f"Questions do not belong to this quiz or not found: {missing}."
+            )
+
+        selections = {}
+        invalid = []
+        for question_id, selected_option in chosen.items():
+            question = questions[question_id]
+            if selected_option not in question.options_set:
+                invalid.append(question_id)
+            selections[question_id] = (selected_option, selected_option == question.answer)
+        if invalid:
+            raise ValidationError(
+                f"Selected option must be one of question_options (questions {sorted(invalid)})."
+            )
+
+        delta = _save_attempt_answers(attempt, selections)
+        _apply_attempt_progress(attempt, delta, payload.validated_data)
         return Response(QuizAttemptSerializer(attempt).data, status=status.HTTP_200_OK)
 
 
 class FinishAttemptView(APIView):
     """
-    Marks an attempt as completed and recalculates score. Write operation => enforce CookieJWTAuthentication.
+    Marks an attempt as completed. Write operation => enforce CookieJWTAuthentication.
+    The score is recounted once here: AttemptResultView treats a completed attempt's
+    counters as final.
     """
     permission_classes = [IsAuthenticated]
     authentication_classes = [CookieJWTAuthentication]
 
     @transaction.atomic
     def post(self, request, attempt_id: int):
-        attempt = _get_attempt_or_403(attempt_id=attempt_id, user=request.user)
+        attempt = _get_attempt_or_403(
+            attempt_id=attempt_id,
+            user_id=request.user.id,
+            select_related=("quiz",),
+            prefetch_related=(_answers_prefetch(),),
+            for_update=True,
+        )
 
-        _recalculate_attempt_score(attempt)
         if not attempt.is_completed:
             attempt.mark_completed()
-        attempt.save()
+            _recalculate_attempt_score(attempt)
+            attempt.save(
+                update_fields=[
+                    "is_completed",
+                    "completed_at",
+                    "correct_count",
+                    "total_questions",
+                    "updated_at",
+                ]
+            )
 
-        attempt = (
-            QuizAttempt.objects.filter(pk=attempt.pk)
-            .select_related("quiz")
-            .prefetch_related("answers")
-            .get()
-        )
         return Response(QuizAttemptSerializer(attempt).data, status=status.HTTP_200_OK)
 
 
@@ -260,19 +673,21 @@ class AttemptResultView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(condition(etag_func=_attempt_result_etag))
     def get(self, request, attempt_id: int):
-        attempt = _get_attempt_or_403(attempt_id=attempt_id, user=request.user)
-        attempt = (
-            QuizAttempt.objects.filter(pk=attempt.pk)
-            .select_related("quiz")
-            .prefetch_related("answers", "quiz__questions")
-            .get()
+        attempt = _get_attempt_or_403(
+            attempt_id=attempt_id, user_id=request.user.id, select_related=("quiz",)
         )
 
-        _recalculate_attempt_score(attempt)
-        attempt.save(update_fields=["correct_count", "total_questions", "updated_at"])
+        # A completed attempt's stored counters are final: no recount, no write.
+        if not attempt.is_completed:
+            stored = (attempt.correct_count, attempt.total_questions)
+            _recalculate_attempt_score(attempt)
+            # Only write when the score drifted, so updated_at (and the ETag) stays stable.
+            if (attempt.correct_count, attempt.total_questions) != stored:
+                attempt.save(update_fields=["correct_count", "total_questions", "updated_at"])
 
-        include_details = request.query_params.get("details") in ("1", "true", "True")
+        include_details = _include_result_details(request)
 
         result = {
             "attempt_id": attempt.id,
@@ -284,20 +699,34 @@ class AttemptResultView(APIView):
         }
 
         if include_details:
-            answer_map = {a.question_id: a for a in attempt.answers.all()}
-            details = []
-            for q in attempt.quiz.questions.all().order_by("id"):
-                a = answer_map.get(q.id)
-                details.append(
-                    {
-                        "question_id": q.id,
-                        "question_title": q.question_title,
-                        "question_options": q.question_options,
-                        "correct_answer": q.answer,
-                        "selected_option": a.selected_option if a else None,
-                        "is_correct": a.is_correct if a else False,
-                    }
+            # One LEFT JOIN of the quiz's questions with this attempt's answers, read as
+            # plain rows; unanswered questions come back with NULL answer columns.
+            rows = (
+                Question.objects.filter(quiz_id=attempt.quiz_id)
+                .annotate(
+                    attempt_answer=FilteredRelation(
+                        "attempt_answers", condition=Q(attempt_answers__attempt_id=attempt.pk)
+                    )
                 )
-            result["details"] = details
-
-        return Response(result, status=status.HTTP_200_OK)
+                .order_by("id")
+                .values_list(
+                    "id",
+                    "question_title",
+                    "question_options",
+                    "answer",
+                    "attempt_answer__selected_option",
+                    "attempt_answer__is_correct",
+                )
+                .iterator()
+            )
+            # Streamed so the first bytes go out before every question is encoded.
+            response = StreamingHttpResponse(
+                _iter_result_json(result, rows), content_type="application/json"
+            )
+        else:
+            response = Response(result, status=status.HTTP_200_OK)
+
+        if attempt.is_completed:
+            # Finished results rarely change; let the browser reuse them for a while.
+            response["Cache-Control"] = _COMPLETED_RESULT_CACHE_CONTROL
+        return response
@@ -1,5 +1,18 @@
+import os
+import threading
 from django.apps import AppConfig
 
 
 class QuizlyAppConfig(AppConfig):
     name = 'quizly_app'
+
+    def ready(self):
+        from quizly_app import signals  # noqa: F401  (registers Question count receivers)
+
+        # Opt-in (e.g. WHISPER_PRELOAD_MODEL=base for the web server) so management
+        # commands don't load the model. Runs on a thread to keep startup fast.
+        preload = os.environ.get("WHISPER_PRELOAD_MODEL", "").strip()
+        if preload:
+            from quizly_app.services.transcription import warm_model
+
+            threading.Thread(target=warm_model, args=(preload,), daemon=True).start()
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-15 10:12
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_questions_count(apps, schema_editor):
+    Quiz = apps.get_model("quizly_app", "Quiz")
+    Question = apps.get_model("quizly_app", "Question")
+    counts = (
+        Question.objects.filter(quiz=models.OuterRef("pk"))
+        .order_by()
+        .values("quiz")
+        .annotate(n=models.Count("pk"))
+        .values("n")
+    )
+    Quiz.objects.update(questions_count=Coalesce(models.Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quizly_app", "0003_attemptanswer_alter_useranswer_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quiz",
+            name="questions_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_questions_count, migrations.RunPython.noop),
+    ]
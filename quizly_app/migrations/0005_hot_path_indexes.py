@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-15 10:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quizly_app", "0004_quiz_questions_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attemptanswer",
+            index=models.Index(
+                fields=["attempt", "is_correct"], name="quizly_app__attempt_a74e98_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                fields=["quiz", "id"], name="quizly_app__quiz_id_a68d27_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quiz",
+            index=models.Index(
+                fields=["user", "-updated_at"], name="quizly_app__user_id_919de0_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-15 11:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quizly_app", "0005_hot_path_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="attemptanswer",
+            name="quizly_app__attempt_7039d2_idx",
+        ),
+        migrations.AddIndex(
+            model_name="quiz",
+            index=models.Index(
+                fields=["user", "-created_at"], name="quizly_app__user_id_136674_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-15 22:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quizly_app", "0007_quizcreationjob"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="quizcreationjob",
+            index=models.Index(
+                fields=["user", "status"], name="quizly_app__user_id_e9e68e_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-15 23:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fail_duplicate_unfinished_jobs(apps, schema_editor):
+    """Keep the newest unfinished job per (user, url) so the constraint can be added."""
+    QuizCreationJob = apps.get_model("quizly_app", "QuizCreationJob")
+    seen = set()
+    duplicates = []
+    unfinished = QuizCreationJob.objects.filter(status__in=["pending", "running"]).order_by("-pk")
+    for pk, user_id, url in unfinished.values_list("pk", "user_id", "url"):
+        if (user_id, url) in seen:
+            duplicates.append(pk)
+        seen.add((user_id, url))
+    QuizCreationJob.objects.filter(pk__in=duplicates).update(
+        status="failed", error="Quiz creation was interrupted. Please try again."
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quizly_app", "0008_quizcreationjob_user_status_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_duplicate_unfinished_jobs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="quizcreationjob",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status__in", ["pending", "running"])),
+                fields=("user", "url"),
+                name="uniq_unfinished_quiz_job",
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import cached_property
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
@@ -15,11 +16,17 @@ class Quiz(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     video_url = models.URLField(max_length=500)
+    # Denormalized number of questions, kept in sync by quizly_app.signals.
+    questions_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+            models.Index(fields=["user", "-updated_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} (#{self.pk})"
@@ -41,10 +48,18 @@ class Question(models.Model):
 
     class Meta:
         ordering = ["id"]
+        indexes = [
+            models.Index(fields=["quiz", "id"]),
+        ]
 
     def __str__(self) -> str:
         return f"Question #{self.pk} (Quiz #{self.quiz_id})"
 
+    @cached_property
+    def options_set(self) -> frozenset:
+        """question_options as a frozenset, built once per instance for membership checks."""
+        return frozenset(self.question_options or ())
+
 
 class QuizAttempt(models.Model):
     """
@@ -131,8 +146,58 @@ class AttemptAnswer(models.Model):
             )
         ]
         indexes = [
-            models.Index(fields=["attempt", "question"]),
+            # (attempt, question) lookups use the unique constraint's index.
+            models.Index(fields=["attempt", "is_correct"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"AttemptAnswer (Attempt #{self.attempt_id}, Question #{self.question_id})"
+
+class QuizCreationJob(models.Model):
+    """
+    A quiz creation running in the background (POST /api/createQuiz/ with "async": true).
+    Clients poll it until it has succeeded (quiz is set) or failed (error is set).
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        SUCCEEDED = "succeeded"
+        FAILED = "failed"
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="quiz_creation_jobs",
+    )
+    url = models.URLField(max_length=500)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    quiz = models.ForeignKey(
+        Quiz,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    UNFINISHED = (Status.PENDING, Status.RUNNING)
+
+    class Meta:
+        ordering = ["-created_at"]
+        constraints = [
+            # At most one queued/running job per user and URL.
+            models.UniqueConstraint(
+                fields=["user", "url"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="uniq_unfinished_quiz_job",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["user", "status"]),
         ]
 
     def __str__(self) -> str:
-        return f"AttemptAnswer (Attempt #{self.attempt_id}, Question #{self.question_id})"
\ No newline at end of file
+        return f"QuizCreationJob #{self.pk} ({self.status})"
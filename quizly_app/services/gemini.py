@@ -1,7 +1,5 @@
 from __future__ import annotations
-import json
 import os
-import time
 from functools import lru_cache
 from typing import Any, Dict, Optional
 from google import genai
@@ -9,48 +7,55 @@ from google.genai.errors import ClientError
 from .utils import QuizlyValidationError, parse_ai_quiz_json, validate_quiz_schema
 
 
+# Static prompt text is built once at import; only the variable part is appended per call.
+_QUIZ_PROMPT_PREFIX = (
+    "Generate a quiz as VALID JSON only.\n"
+    "Return exactly ONE JSON object and nothing else.\n\n"
+    "Schema:\n"
+    "{\n"
+    '  "title": "string",\n'
+    '  "description": "string (<= 150 characters)",\n'
+    '  "questions": [\n'
+    "    {\n"
+    '      "question_title": "string",\n'
+    '      "question_options": ["string", "string", "string", "string"],\n'
+    '      "answer": "string (must be one of question_options)"\n'
+    "    }\n"
+    "  ]\n"
+    "}\n\n"
+    "Hard rules:\n"
+    "- Output MUST be parsable with json.loads().\n"
+    "- questions MUST contain EXACTLY 10 items.\n"
+    "- Each question_options MUST contain EXACTLY 4 DISTINCT strings.\n"
+    "- Do NOT include markdown, code fences, comments, ellipsis '...', or extra text.\n\n"
+    "Transcript:\n"
+)
+
+_FIX_PROMPT_PREFIX = (
+    "Fix the following JSON to match these rules and return VALID JSON only:\n"
+    "- Root object must contain: title, description, questions\n"
+    "- questions MUST contain EXACTLY 10 items\n"
+    "- Each item must contain: question_title, question_options (exactly 4 distinct strings), answer\n"
+    "- answer MUST be one of question_options\n"
+    "- Remove any extra keys, markdown, comments, and ellipsis\n\n"
+    "JSON to fix:\n"
+)
+
+
 def build_quiz_prompt(transcript: str) -> str:
     """Build a strict JSON-only prompt for quiz generation."""
     if not transcript or not transcript.strip():
         raise QuizlyValidationError("Transcript is empty.")
 
-    return (
-        "Generate a quiz as VALID JSON only.\n"
-        "Return exactly ONE JSON object and nothing else.\n\n"
-        "Schema:\n"
-        "{\n"
-        '  "title": "string",\n'
-        '  "description": "string (<= 150 characters)",\n'
-        '  "questions": [\n'
-        "    {\n"
-        '      "question_title": "string",\n'
-        '      "question_options": ["string", "string", "string", "string"],\n'
-        '      "answer": "string (must be one of question_options)"\n'
-        "    }\n"
-        "  ]\n"
-        "}\n\n"
-        "Hard rules:\n"
-        "- Output MUST be parsable with json.loads().\n"
-        "- questions MUST contain EXACTLY 10 items.\n"
-        "- Each question_options MUST contain EXACTLY 4 DISTINCT strings.\n"
-        "- Do NOT include markdown, code fences, comments, ellipsis '...', or extra text.\n\n"
-        "Transcript:\n"
-        f"{transcript.strip()}\n"
-    )
-
-
-def build_fix_prompt(broken_quiz: Dict[str, Any]) -> str:
-    """Ask the model to repair the JSON to match the strict schema."""
-    return (
-        "Fix the following JSON to match these rules and return VALID JSON only:\n"
-        "- Root object must contain: title, description, questions\n"
-        "- questions MUST contain EXACTLY 10 items\n"
-        "- Each item must contain: question_title, question_options (exactly 4 distinct strings), answer\n"
-        "- answer MUST be one of question_options\n"
-        "- Remove any extra keys, markdown, comments, and ellipsis\n\n"
-        "JSON to fix:\n"
-        f"{json.dumps(broken_quiz, ensure_ascii=False)}\n"
-    )
+    return _QUIZ_PROMPT_PREFIX + transcript.strip() + "\n"
+
+
+def build_fix_prompt(broken_json: str) -> str:
+    """
+    Ask the model to repair the JSON to match the strict schema.
+    Takes the model's own output text, so the parsed dict is not serialized again.
+    """
+    return _FIX_PROMPT_PREFIX + broken_json.strip() + "\n"
 
 
 @lru_cache(maxsize=1)
@@ -102,7 +107,7 @@ def generate_quiz_from_transcript(
             try:
                 return validate_quiz_schema(data)
             except QuizlyValidationError:
-                fixed_prompt = build_fix_prompt(data)
+                fixed_prompt = build_fix_prompt(raw_text)
                 fixed_raw = _call_gemini(fixed_prompt, model=model)
                 fixed_data = parse_ai_quiz_json(fixed_raw)
                 return validate_quiz_schema(fixed_data)
@@ -119,9 +124,10 @@ def generate_quiz_from_transcript(
             raise QuizlyValidationError(f"Gemini request failed (HTTP {status_code}).") from exc
 
         except QuizlyValidationError as exc:
+            # Malformed output is not a rate/availability problem, so retry immediately
+            # instead of blocking the worker thread; HTTP errors are raised above.
             last_error = exc
             if attempt < max_attempts:
-                time.sleep(1.0)
                 continue
             raise
 
@@ -1,13 +1,13 @@
 from __future__ import annotations
+import threading
 from django.db import transaction
 from quizly_app.models import Question, Quiz
 from quizly_app.services.gemini import generate_quiz_from_transcript
-from quizly_app.services.transcription import transcribe_audio
+from quizly_app.services.transcription import transcribe_audio, warm_model
 from quizly_app.services.utils import QuizlyValidationError
 from quizly_app.services.youtube import download_youtube_audio
 
 
-@transaction.atomic
 def create_quiz_for_user(user, url: str, whisper_model: str = "base") -> Quiz:
     """
     End-to-end pipeline:
@@ -15,34 +15,48 @@ def create_quiz_for_user(user, url: str, whisper_model: str = "base") -> Quiz:
     - transcribe via Whisper
     - generate quiz via Gemini
     - persist Quiz + Questions
+
+    Only the final persistence step runs in a transaction, so no transaction is
+    held open during the download, transcription and Gemini calls.
     """
+    # Load the Whisper model while the audio downloads (no-op once it is cached).
+    warm_up = threading.Thread(target=warm_model, args=(whisper_model,), daemon=True)
+    warm_up.start()
+
     download = download_youtube_audio(url)
+    warm_up.join()
 
     try:
-        transcript = transcribe_audio(download.audio_path, model_name=whisper_model)
+        try:
+            transcript = transcribe_audio(download.audio_path, model_name=whisper_model)
+        finally:
+            # The audio is only needed for transcription.
+            download.cleanup()
         quiz_data = generate_quiz_from_transcript(transcript)
     except QuizlyValidationError:
         raise
     except Exception as exc:
         raise QuizlyValidationError("Quiz creation failed unexpectedly. Please try again.") from exc
 
-    quiz = Quiz.objects.create(
-        user=user,
-        title=quiz_data["title"],
-        description=quiz_data["description"],
-        video_url=download.video_url,
-    )
+    with transaction.atomic():
+        quiz = Quiz.objects.create(
+            user=user,
+            title=quiz_data["title"],
+            description=quiz_data["description"],
+            video_url=download.video_url,
+            # bulk_create() below sends no post_save signals, so the count is set up front.
+            questions_count=len(quiz_data["questions"]),
+        )
 
-    questions = []
-    for q in quiz_data["questions"]:
-        questions.append(
+        questions = [
             Question(
                 quiz=quiz,
                 question_title=q["question_title"],
                 question_options=q["question_options"],
                 answer=q["answer"],
             )
-        )
+            for q in quiz_data["questions"]
+        ]
 
-    Question.objects.bulk_create(questions)
+        Question.objects.bulk_create(questions, batch_size=500)
     return quiz
@@ -0,0 +1,87 @@
+from __future__ import annotations
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+from quizly_app.models import QuizCreationJob
+from quizly_app.services.quiz_creation import create_quiz_for_user
+from quizly_app.services.utils import QuizlyValidationError
+
+logger = logging.getLogger(__name__)
+
+# In-process worker pool: the download/transcription/Gemini chain runs here instead of
+# holding a request worker for the whole pipeline. Jobs still pending or running when
+# the process exits are lost; once they are older than _STALE_AFTER they are marked
+# failed (on the next submit of the same URL or poll), so the quiz can be created again.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("QUIZ_JOB_WORKERS", "2")),
+    thread_name_prefix="quiz-job",
+)
+
+_STALE_AFTER = timedelta(minutes=int(os.environ.get("QUIZ_JOB_STALE_MINUTES", "60")))
+_STALE_ERROR = "Quiz creation was interrupted. Please try again."
+
+
+def expire_stale_jobs(**filters) -> None:
+    """Marks matching pending/running jobs untouched for _STALE_AFTER as failed."""
+    QuizCreationJob.objects.filter(
+        status__in=QuizCreationJob.UNFINISHED,
+        updated_at__lt=timezone.now() - _STALE_AFTER,
+        **filters,
+    ).update(status=QuizCreationJob.Status.FAILED, error=_STALE_ERROR, updated_at=timezone.now())
+
+
+def submit_quiz_job(user, url: str) -> QuizCreationJob:
+    """
+    Store a pending job for the user and queue it on the worker pool.
+    A repeated submit of a URL the user already has queued or running returns that
+    job instead (enforced by the uniq_unfinished_quiz_job constraint), so double
+    submits do not occupy a second worker.
+    """
+    expire_stale_jobs(user=user, url=url)
+    try:
+        with transaction.atomic():
+            job = QuizCreationJob.objects.create(user=user, url=url)
+    except IntegrityError:
+        existing = QuizCreationJob.objects.filter(
+            user=user, url=url, status__in=QuizCreationJob.UNFINISHED
+        ).first()
+        if existing is None:
+            raise
+        return existing
+
+    # Queued after commit, so the worker thread always sees the job row.
+    transaction.on_commit(lambda: _EXECUTOR.submit(_run_quiz_job, job.pk))
+    return job
+
+
+def _run_quiz_job(job_id: int) -> None:
+    """Runs create_quiz_for_user for a job and records the outcome on it."""
+    try:
+        job = QuizCreationJob.objects.select_related("user").get(pk=job_id)
+        _set_status(job, QuizCreationJob.Status.RUNNING)
+
+        try:
+            job.quiz = create_quiz_for_user(user=job.user, url=job.url)
+        except QuizlyValidationError as exc:
+            logger.exception("createQuiz job %s failed: %s", job_id, exc)
+            job.error = str(exc)
+            _set_status(job, QuizCreationJob.Status.FAILED, "error")
+        except Exception:
+            logger.exception("createQuiz job %s failed unexpectedly", job_id)
+            job.error = "Quiz creation failed unexpectedly. Please try again."
+            _set_status(job, QuizCreationJob.Status.FAILED, "error")
+        else:
+            _set_status(job, QuizCreationJob.Status.SUCCEEDED, "quiz")
+    except Exception:
+        logger.exception("createQuiz job %s could not be processed", job_id)
+    finally:
+        # Each worker thread opens its own DB connection; release it between jobs.
+        connection.close()
+
+
+def _set_status(job: QuizCreationJob, status: str, *fields: str) -> None:
+    job.status = status
+    job.save(update_fields=["status", *fields, "updated_at"])
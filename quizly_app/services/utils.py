@@ -1,17 +1,26 @@
 from __future__ import annotations
-import json
 import os
 import re
 import shutil
+import string
+from functools import lru_cache
 from typing import Any, Dict, List
 from urllib.parse import parse_qs, urlparse
+import orjson
 
 
 class QuizlyValidationError(ValueError):
     """Raised when inputs or AI outputs do not match the expected format."""
 
 
-_YOUTUBE_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_YOUTUBE_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_FENCE_HEAD_RE = re.compile(r"^\s*```(?:json)?\s*", re.IGNORECASE)
+_FENCE_TAIL_RE = re.compile(r"\s*```\s*$")
+
+
+def _is_youtube_id(value: str) -> bool:
+    """11 characters of [A-Za-z0-9_-]; a set check instead of a regex match."""
+    return len(value) == 11 and _YOUTUBE_ID_CHARS.issuperset(value)
 
 
 def extract_youtube_video_id(url: str) -> str:
@@ -40,7 +49,7 @@ def extract_youtube_video_id(url: str) -> str:
         if path:
             video_id = (path.split("/", 1)[0] or "").strip()
 
-    if not video_id or not _YOUTUBE_ID_RE.match(video_id):
+    if not video_id or not _is_youtube_id(video_id):
         raise QuizlyValidationError("Could not extract a valid YouTube video ID.")
 
     return video_id
@@ -48,7 +57,7 @@ def extract_youtube_video_id(url: str) -> str:
 
 def canonical_youtube_url(video_id: str) -> str:
     """Return canonical URL format: https://www.youtube.com/watch?v=VIDEO_ID"""
-    if not video_id or not _YOUTUBE_ID_RE.match(video_id):
+    if not video_id or not _is_youtube_id(video_id):
         raise QuizlyValidationError("Invalid video ID.")
     return f"https://www.youtube.com/watch?v={video_id}"
 
@@ -58,8 +67,11 @@ def strip_markdown_fences(text: str) -> str:
     if text is None:
         return ""
     cleaned = text.strip()
-    cleaned = re.sub(r"^\s*```(?:json)?\s*", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*```\s*$", "", cleaned)
+    # Most responses have no fences; only run the patterns when there can be one.
+    if cleaned.startswith("```"):
+        cleaned = _FENCE_HEAD_RE.sub("", cleaned, count=1)
+    if cleaned.endswith("```"):
+        cleaned = _FENCE_TAIL_RE.sub("", cleaned, count=1)
     return cleaned.strip()
 
 
@@ -75,10 +87,18 @@ def extract_json_object(text: str) -> str:
 
 def parse_ai_quiz_json(raw_text: str) -> Dict[str, Any]:
     """Parse AI output into a Python dict (expects a JSON object)."""
+    # Common case: the output (minus fences) already is the object, no slicing needed.
+    try:
+        data = orjson.loads(strip_markdown_fences(raw_text))
+    except orjson.JSONDecodeError:
+        data = None
+    if isinstance(data, dict):
+        return data
+
     json_text = extract_json_object(raw_text)
     try:
-        data = json.loads(json_text)
-    except json.JSONDecodeError as exc:
+        data = orjson.loads(json_text)
+    except orjson.JSONDecodeError as exc:
         raise QuizlyValidationError(f"AI output JSON is not parsable: {exc}") from exc
 
     if not isinstance(data, dict):
@@ -115,12 +135,17 @@ def validate_quiz_schema(data: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(options, list) or len(options) != 4:
             raise QuizlyValidationError(f"Question {idx}: must have exactly 4 options.")
 
-        cleaned_options = [str(opt).strip() for opt in options]
-        if any(not opt for opt in cleaned_options):
-            raise QuizlyValidationError(f"Question {idx}: empty option found.")
-        if len(set(cleaned_options)) != 4:
-            raise QuizlyValidationError(f"Question {idx}: options must be distinct.")
-        if answer not in cleaned_options:
+        # One pass: strip, reject empty/duplicate options; the dict keeps the order.
+        seen: Dict[str, None] = {}
+        for opt in options:
+            cleaned = str(opt).strip()
+            if not cleaned:
+                raise QuizlyValidationError(f"Question {idx}: empty option found.")
+            if cleaned in seen:
+                raise QuizlyValidationError(f"Question {idx}: options must be distinct.")
+            seen[cleaned] = None
+        cleaned_options = list(seen)
+        if answer not in seen:
             raise QuizlyValidationError(f"Question {idx}: answer must be one of the options.")
 
         cleaned_questions.append(
@@ -138,12 +163,20 @@ def validate_quiz_schema(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
+def _detected_js_runtime() -> str:
+    """Looks for deno on PATH once per process instead of on every download."""
+    return "deno" if shutil.which("deno") else ""
+
+
 def build_yt_dlp_options(tmp_filename: str) -> Dict[str, Any]:
     """
     Create a yt-dlp options dictionary for downloading best-quality audio from YouTube.
 
     The returned options:
-    - download audio-only with best available quality
+    - download audio-only with best available quality (m4a preferred, stored as-is)
+    - never transcode: the file is decoded directly for Whisper
+    - fetch DASH fragments in parallel
     - write the output using the given template path
     - suppress most yt-dlp console output
     - avoid downloading playlists
@@ -152,7 +185,9 @@ def build_yt_dlp_options(tmp_filename: str) -> Dict[str, Any]:
         raise QuizlyValidationError("tmp_filename is required for yt-dlp options.")
 
     opts: Dict[str, Any] = {
-        "format": "bestaudio/best",
+        "format": "bestaudio[ext=m4a]/bestaudio/best",
+        "postprocessors": [],
+        "concurrent_fragment_downloads": 4,
         "outtmpl": tmp_filename,
         "quiet": True,
         "noplaylist": True,
@@ -162,7 +197,7 @@ def build_yt_dlp_options(tmp_filename: str) -> Dict[str, Any]:
     runtime_path = (os.environ.get("YTDLP_JS_RUNTIME_PATH") or "").strip()
 
     if not runtime:
-        runtime = "deno" if shutil.which("deno") else ""
+        runtime = _detected_js_runtime()
 
     if runtime:
         js_cfg: Dict[str, Any] = {}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+import shutil
 import tempfile
 from dataclasses import dataclass
 from typing import Tuple
@@ -19,6 +20,11 @@ class DownloadResult:
     video_id: str
     video_url: str
     audio_path: str
+    work_dir: str
+
+    def cleanup(self) -> None:
+        """Delete the download directory (and the audio file in it)."""
+        shutil.rmtree(self.work_dir, ignore_errors=True)
 
 
 def download_youtube_audio(url: str) -> DownloadResult:
@@ -28,16 +34,15 @@ def download_youtube_audio(url: str) -> DownloadResult:
         DownloadResult: includes canonical video_url and the downloaded audio file path.
 
         Use a stable template. yt-dlp will choose the correct extension.
-        yt-dlp may return different keys depending on extraction result    
-        Persist the audio file to a non-temp location by copying it out.
-        The TemporaryDirectory will be deleted after this function returns,
-        so we must move the file to a new temp file that survives.
+        yt-dlp may return different keys depending on extraction result
+        The file stays where yt-dlp wrote it (no copy/move to another temp
+        location); the caller deletes it with DownloadResult.cleanup().
     """
     video_id = extract_youtube_video_id(url)
     video_url = canonical_youtube_url(video_id)
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        
+    tmp_dir = tempfile.mkdtemp(prefix="quizly-")
+    try:
         tmp_filename = os.path.join(tmp_dir, f"{video_id}.%(ext)s")
         ydl_opts = build_yt_dlp_options(tmp_filename)
 
@@ -47,10 +52,13 @@ def download_youtube_audio(url: str) -> DownloadResult:
         downloaded_path = _resolve_downloaded_filepath(info, video_id, tmp_dir)
         if not downloaded_path or not os.path.exists(downloaded_path):
             raise QuizlyValidationError("Audio download failed: output file not found.")
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
 
-        final_path = _persist_file(downloaded_path)
-
-    return DownloadResult(video_id=video_id, video_url=video_url, audio_path=final_path)
+    return DownloadResult(
+        video_id=video_id, video_url=video_url, audio_path=downloaded_path, work_dir=tmp_dir
+    )
 
 def _resolve_downloaded_filepath(info: dict, video_id: str, tmp_dir: str) -> str:
     """Resolve the final audio filepath created by yt-dlp."""
@@ -59,17 +67,10 @@ def _resolve_downloaded_filepath(info: dict, video_id: str, tmp_dir: str) -> str
     if filename:
         return filename
 
-    for name in os.listdir(tmp_dir):
-        if name.startswith(video_id + "."):
-            return os.path.join(tmp_dir, name)
+    prefix = video_id + "."
+    with os.scandir(tmp_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix):
+                return entry.path
 
     return ""
-
-def _persist_file(src_path: str) -> str:
-    """Move the downloaded file to a persistent temp file and return its path."""
-    suffix = os.path.splitext(src_path)[1] or ".audio"
-    fd, dst_path = tempfile.mkstemp(suffix=suffix)
-    os.close(fd)
-
-    os.replace(src_path, dst_path)
-    return dst_path
\ No newline at end of file
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from quizly_app.models import Question, Quiz
+
+
+@receiver(post_save, sender=Question, dispatch_uid="quizly_question_saved")
+def touch_quiz_on_question_save(sender, instance: Question, created: bool, **kwargs) -> None:
+    """
+    Bumps Quiz.updated_at on every question save (the cached quiz JSON and the ETags
+    are keyed on it) and keeps Quiz.questions_count in sync when a question is added.
+    """
+    updates = {"updated_at": timezone.now()}
+    if created:
+        updates["questions_count"] = F("questions_count") + 1
+    Quiz.objects.filter(pk=instance.quiz_id).update(**updates)
+
+
+@receiver(post_delete, sender=Question, dispatch_uid="quizly_question_deleted")
+def decrement_questions_count(sender, instance: Question, **kwargs) -> None:
+    """Keeps Quiz.questions_count in sync when a question is removed."""
+    Quiz.objects.filter(pk=instance.quiz_id, questions_count__gt=0).update(
+        questions_count=F("questions_count") - 1, updated_at=timezone.now()
+    )
@@ -1,3 +1,402 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from quizly_app.models import AttemptAnswer, Question, Quiz, QuizAttempt, QuizCreationJob
+from quizly_app.services import quiz_jobs
+from quizly_app.services.utils import QuizlyValidationError
+
+User = get_user_model()
+
+VIDEO_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+PASSWORD = "s3cret-pass"
+
+
+def make_user(username):
+    return User.objects.create_user(
+        username=username, email=f"{username}@example.com", password=PASSWORD
+    )
+
+
+def make_quiz(user, questions=3, title="Quiz"):
+    """A quiz with `questions` questions whose correct answer is always "A"."""
+    quiz = Quiz.objects.create(user=user, title=title, video_url=VIDEO_URL)
+    for i in range(questions):
+        Question.objects.create(
+            quiz=quiz,
+            question_title=f"Question {i + 1}",
+            question_options=["A", "B", "C", "D"],
+            answer="A",
+        )
+    quiz.refresh_from_db()
+    return quiz
+
+
+class LoginMixin:
+    def login(self, user, client=None):
+        client = client or self.client
+        response = client.post(
+            reverse("login"),
+            {"username": user.username, "password": PASSWORD},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        return client
+
+
+class QuizCachingTests(LoginMixin, TestCase):
+    """ETag/304 handling and cache invalidation of GET /api/quizzes/ and /api/quizzes/{id}/."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("frank")
+        cls.quiz = make_quiz(cls.user, title="Original")
+        make_quiz(cls.user, title="Second")
+
+    def setUp(self):
+        cache.clear()
+        self.login(self.user)
+        self.list_url = reverse("quiz-list")
+        self.detail_url = reverse("quiz-detail", args=[self.quiz.pk])
+
+    def rename(self, title):
+        response = self.client.patch(
+            self.detail_url, {"title": title}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def titles(self, response):
+        return sorted(quiz["title"] for quiz in response.json())
+
+    def test_list_revalidates_with_etag(self):
+        first = self.client.get(self.list_url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(self.titles(first), ["Original", "Second"])
+
+        repeat = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.content, b"")
+
+    def test_list_items_match_the_detail_payload(self):
+        listed = self.client.get(self.list_url).json()
+        detail = self.client.get(self.detail_url).json()
+
+        self.assertEqual(next(row for row in listed if row["id"] == self.quiz.pk), detail)
+
+    def test_detail_revalidates_with_etag(self):
+        first = self.client.get(self.detail_url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()["title"], "Original")
+        self.assertEqual(len(first.json()["questions"]), 3)
+
+        repeat = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.content, b"")
+
+    def test_cached_detail_costs_one_quiz_query(self):
+        self.client.get(self.detail_url)
+
+        # The user lookup plus one updated_at read shared by the ETag and the cache key.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_patch_invalidates_list_and_detail(self):
+        list_etag = self.client.get(self.list_url)["ETag"]
+        detail_etag = self.client.get(self.detail_url)["ETag"]
+
+        self.rename("Renamed")
+
+        listed = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(listed.status_code, 200)
+        self.assertNotEqual(listed["ETag"], list_etag)
+        self.assertEqual(self.titles(listed), ["Renamed", "Second"])
+
+        detail = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(detail.status_code, 200)
+        self.assertNotEqual(detail["ETag"], detail_etag)
+        self.assertEqual(detail.json()["title"], "Renamed")
+
+    def test_question_edit_refreshes_cached_detail(self):
+        self.assertEqual(self.client.get(self.detail_url).status_code, 200)
+        # Saved the way QuestionAdmin saves it.
+        question = self.quiz.questions.first()
+        question.question_title = "Edited question"
+        question.save()
+
+        detail = self.client.get(self.detail_url)
+
+        self.assertEqual(detail.status_code, 200)
+        self.assertEqual(detail.json()["questions"][0]["question_title"], "Edited question")
+
+    def test_question_edit_changes_etags(self):
+        list_etag = self.client.get(self.list_url)["ETag"]
+        detail_etag = self.client.get(self.detail_url)["ETag"]
+        question = self.quiz.questions.first()
+        question.question_options = ["A", "B", "C", "E"]
+        question.save()
+
+        listed = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_etag)
+        detail = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+
+        self.assertEqual(listed.status_code, 200)
+        self.assertEqual(detail.status_code, 200)
+        self.assertEqual(detail.json()["questions"][0]["question_options"], ["A", "B", "C", "E"])
+
+    def test_question_edit_refreshes_cached_list(self):
+        self.assertEqual(self.client.get(self.list_url).status_code, 200)
+        question = self.quiz.questions.first()
+        question.answer = "B"
+        question.save()
+
+        listed = self.client.get(self.list_url)
+
+        quiz = next(row for row in listed.json() if row["id"] == self.quiz.pk)
+        self.assertEqual(quiz["questions"][0]["answer"], "B")
+
+    def test_delete_invalidates_list(self):
+        list_etag = self.client.get(self.list_url)["ETag"]
+
+        self.assertEqual(self.client.delete(self.detail_url).status_code, 204)
+
+        listed = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(listed.status_code, 200)
+        self.assertEqual(self.titles(listed), ["Second"])
+
+    def test_etag_is_not_shared_between_users(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        self.login(make_user("grace"))
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+        self.assertEqual(self.client.get(self.detail_url).status_code, 403)
+
+
+class SaveAnswersBatchTests(LoginMixin, TestCase):
+    """PATCH /api/attempts/{id}/answers/"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("dave")
+        cls.quiz = make_quiz(cls.user, questions=4)
+        cls.questions = list(cls.quiz.questions.all())
+
+    def setUp(self):
+        self.login(self.user)
+        response = self.client.post(reverse("attempt-start", args=[self.quiz.pk]))
+        self.assertEqual(response.status_code, 201)
+        self.attempt_id = response.json()["id"]
+
+    def save(self, answers, **extra):
+        return self.client.patch(
+            reverse("attempt-answers", args=[self.attempt_id]),
+            {"answers": answers, **extra},
+            content_type="application/json",
+        )
+
+    def answer(self, index, option):
+        return {"question_id": self.questions[index].pk, "selected_option": option}
+
+    def assertCountMatchesRecount(self, body):
+        attempt = QuizAttempt.objects.get(pk=self.attempt_id)
+        recount = AttemptAnswer.objects.filter(attempt=attempt, is_correct=True).count()
+        self.assertEqual(attempt.correct_count, recount)
+        self.assertEqual(body["correct_count"], recount)
+
+    def test_saves_all_answers_in_one_request(self):
+        response = self.save(
+            [self.answer(0, "A"), self.answer(1, "B"), self.answer(2, "A")],
+            current_question_index=3,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["current_question_index"], 3)
+        self.assertEqual(body["correct_count"], 2)
+        self.assertEqual(
+            {a["question_id"]: (a["selected_option"], a["is_correct"]) for a in body["answers"]},
+            {
+                self.questions[0].pk: ("A", True),
+                self.questions[1].pk: ("B", False),
+                self.questions[2].pk: ("A", True),
+            },
+        )
+        self.assertCountMatchesRecount(body)
+
+    def test_changed_answers_keep_correct_count_in_sync(self):
+        self.save([self.answer(0, "A"), self.answer(1, "A"), self.answer(2, "C")])
+        # Correct -> wrong, wrong -> correct, new correct, and a repeated question
+        # where the last entry wins.
+        response = self.save(
+            [
+                self.answer(0, "D"),
+                self.answer(2, "A"),
+                self.answer(3, "B"),
+                self.answer(3, "A"),
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["correct_count"], 3)
+        self.assertEqual(len(body["answers"]), 4)
+        self.assertEqual(AttemptAnswer.objects.filter(attempt_id=self.attempt_id).count(), 4)
+        self.assertCountMatchesRecount(body)
+
+    def test_finish_recounts_the_score(self):
+        self.save([self.answer(0, "A"), self.answer(1, "A")])
+        # Counter drift (e.g. from an older release) is corrected on completion.
+        QuizAttempt.objects.filter(pk=self.attempt_id).update(correct_count=0)
+
+        response = self.save([self.answer(2, "B")], finish=True)
+
+        body = response.json()
+        self.assertTrue(body["is_completed"])
+        self.assertEqual(body["correct_count"], 2)
+        self.assertEqual(body["total_questions"], 4)
+        self.assertCountMatchesRecount(body)
+
+    def test_option_not_in_question_options_is_rejected(self):
+        self.save([self.answer(0, "A")])
+
+        response = self.save([self.answer(0, "B"), self.answer(1, "Z")])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(str(self.questions[1].pk), str(response.json()))
+        # Nothing from the rejected batch is stored.
+        stored = AttemptAnswer.objects.get(attempt_id=self.attempt_id)
+        self.assertEqual((stored.question_id, stored.selected_option), (self.questions[0].pk, "A"))
+        self.assertEqual(QuizAttempt.objects.get(pk=self.attempt_id).correct_count, 1)
+
+    def test_question_of_another_quiz_is_rejected(self):
+        other = make_quiz(self.user, questions=1).questions.get()
+
+        response = self.save([self.answer(0, "A"), {"question_id": other.pk, "selected_option": "A"}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(AttemptAnswer.objects.filter(attempt_id=self.attempt_id).exists())
+
+    def test_empty_batch_is_rejected(self):
+        self.assertEqual(self.save([]).status_code, 400)
+
+    def test_other_users_attempt_is_forbidden(self):
+        self.login(make_user("erin"))
+
+        self.assertEqual(self.save([self.answer(0, "A")]).status_code, 403)
+
+
+class QuizCreationJobTests(LoginMixin, TransactionTestCase):
+    """POST /api/createQuiz/ with "async": true and polling the returned job."""
+
+    def setUp(self):
+        self.user = make_user("alice")
+        self.login(self.user)
+        # A private pool, so the test can wait for the queued job to finish.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        patcher = mock.patch.object(quiz_jobs, "_EXECUTOR", self.executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.executor.shutdown)
+
+    def submit(self, url=VIDEO_URL):
+        return self.client.post(
+            reverse("quiz-create"), {"url": url, "async": True}, content_type="application/json"
+        )
+
+    def poll(self, job_id):
+        self.executor.shutdown(wait=True)
+        return self.client.get(reverse("quiz-create-job", args=[job_id]))
+
+    def test_job_succeeds_and_points_to_the_quiz(self):
+        with mock.patch.object(
+            quiz_jobs, "create_quiz_for_user", side_effect=lambda user, url: make_quiz(user)
+        ) as create:
+            response = self.submit()
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.json()["status"], "pending")
+            job = self.poll(response.json()["id"]).json()
+
+        create.assert_called_once_with(user=self.user, url=VIDEO_URL)
+        self.assertEqual(job["status"], "succeeded")
+        self.assertEqual(job["error"], "")
+        quiz = Quiz.objects.get()
+        self.assertEqual(job["quiz_id"], quiz.id)
+        self.assertEqual(quiz.user, self.user)
+
+    def test_job_failure_is_reported(self):
+        with mock.patch.object(
+            quiz_jobs, "create_quiz_for_user", side_effect=QuizlyValidationError("No audio.")
+        ), self.assertLogs("quizly_app.services.quiz_jobs", "ERROR"):
+            job = self.poll(self.submit().json()["id"]).json()
+
+        self.assertEqual(job["status"], "failed")
+        self.assertEqual(job["error"], "No audio.")
+        self.assertIsNone(job["quiz_id"])
+
+    def test_invalid_url_is_rejected_without_a_job(self):
+        response = self.submit(url="https://example.com/video")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(QuizCreationJob.objects.exists())
+
+    def test_other_users_job_is_forbidden(self):
+        job = QuizCreationJob.objects.create(user=make_user("bob"), url=VIDEO_URL)
+
+        self.assertEqual(self.client.get(reverse("quiz-create-job", args=[job.pk])).status_code, 403)
+        self.assertEqual(self.client.get(reverse("quiz-create-job", args=[job.pk + 1])).status_code, 404)
+
+
+class QuizCreationJobDedupeTests(LoginMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("carol")
+
+    def setUp(self):
+        self.login(self.user)
+        # Nothing runs: jobs stay pending.
+        patcher = mock.patch.object(quiz_jobs, "_EXECUTOR")
+        self.executor = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def submit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("quiz-create"),
+                {"url": VIDEO_URL, "async": True},
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 202)
+        return response.json()
+
+    def test_repeated_submit_returns_the_unfinished_job(self):
+        first = self.submit()
+        second = self.submit()
+
+        self.assertEqual(first["id"], second["id"])
+        self.assertEqual(QuizCreationJob.objects.count(), 1)
+        self.executor.submit.assert_called_once_with(quiz_jobs._run_quiz_job, first["id"])
+
+    def test_orphaned_job_is_expired_and_replaced(self):
+        first = self.submit()
+        QuizCreationJob.objects.filter(pk=first["id"]).update(
+            updated_at=timezone.now() - quiz_jobs._STALE_AFTER - timedelta(minutes=1)
+        )
+
+        polled = self.client.get(reverse("quiz-create-job", args=[first["id"]])).json()
+        second = self.submit()
+
+        self.assertEqual(polled["status"], "failed")
+        self.assertEqual(polled["error"], quiz_jobs._STALE_ERROR)
+        self.assertNotEqual(second["id"], first["id"])
+        self.assertEqual(second["status"], "pending")